@@ -24,6 +24,9 @@ class AnalyzeFlow(picamera.array.PiMotionAnalysis):
 
         self.altitude = 0.0
 
+        # the twist message that is published, reused for every frame
+        self.twist_msg = TwistStamped()
+
         # ROS setup:
         ############
         # Publisher:
@@ -38,14 +41,18 @@ class AnalyzeFlow(picamera.array.PiMotionAnalysis):
         a : an array of the incoming motion data that is provided by the
             PiMotionAnalysis api
         '''
-        # signed 1-byte values
-        x = a['x']
-        y = a['y']
+        # each motion vector is packed as (x, y, sad) in 4 bytes, with x and y
+        # as signed 1-byte values. view the records as raw bytes so that both
+        # the x and y columns are summed in a single reduction. int32 is wide
+        # enough for any frame (int16 would overflow above ~256 vectors)
+        xy = a.view(np.int8).reshape(-1, 4)[:, :2]
+        x_sum, y_sum = xy.sum(axis=0, dtype=np.int32)
 
         # calculate the planar and yaw motions
-        x_motion = np.sum(x) * self.flow_coeff * self.altitude
-        y_motion = np.sum(y) * self.flow_coeff * self.altitude
-        twist_msg = TwistStamped()
+        flow_gain = self.flow_coeff * self.altitude
+        x_motion = x_sum * flow_gain
+        y_motion = y_sum * flow_gain
+        twist_msg = self.twist_msg
         twist_msg.header.stamp = rospy.Time.now()
         twist_msg.twist.linear.x = self.near_zero(x_motion)
         twist_msg.twist.linear.y = - self.near_zero(y_motion)
@@ -26,17 +26,21 @@ class Mocap(object):
         self.twistpub = None
         self.accelpub = None
 
-        # check if the mocap data is streaming
-        self.received_data = False
+        # store the messages that are published, reused for every callback
+        self.pose_to_pub = PoseWithCovarianceStamped()
+        self.pose_to_pub.header.frame_id = 'World'
+        self.twist_to_pub = TwistWithCovarianceStamped()
+        self.twist_to_pub.header.frame_id = 'World'
+        self.accel_to_pub = AccelWithCovarianceStamped()
+        self.accel_to_pub.header.frame_id = 'World'
 
     def pose_callback(self, msg):
         ''' Publish the pose of the drone based on the Motion Tracker data '''
         # NOTICE: the positions and orientations are modified because the axes
         # of the mocap are set up as right-handed y-up. This means that the y
         # and z axes are switched, and positive x is to the left.
-        pose_to_pub = PoseWithCovarianceStamped()
+        pose_to_pub = self.pose_to_pub
         pose_to_pub.header.stamp = msg.header.stamp
-        pose_to_pub.header.frame_id = 'World'
         pose_to_pub.pose.pose.position.x = - msg.pose.position.x
         pose_to_pub.pose.pose.position.y = msg.pose.position.z
         pose_to_pub.pose.pose.position.z = msg.pose.position.y
@@ -45,16 +49,13 @@ class Mocap(object):
         pose_to_pub.pose.pose.orientation.z = msg.pose.orientation.y
         self.posepub.publish(pose_to_pub)
 
-        self.received_data = True
-
     def twist_callback(self, msg):
         ''' Publish the twist of the drone based on the Motion Tracker data '''
         # NOTICE: the velocities are modified because the axes
         # of the mocap are set up as right-handed y-up. This means that the y
         # and z axes are switched, and positive x is to the left.
-        twist_to_pub = TwistWithCovarianceStamped()
+        twist_to_pub = self.twist_to_pub
         twist_to_pub.header.stamp = msg.header.stamp
-        twist_to_pub.header.frame_id = 'World'
         twist_to_pub.twist.twist.linear.x = - msg.twist.linear.x
         twist_to_pub.twist.twist.linear.y = msg.twist.linear.z
         twist_to_pub.twist.twist.linear.z = msg.twist.linear.y
@@ -68,9 +69,8 @@ class Mocap(object):
         # NOTICE: the accelerations are modified because the axes
         # of the mocap are set up as right-handed y-up. This means that the y
         # and z axes are switched, and positive x is to the left.
-        accel_to_pub = AccelWithCovarianceStamped()
-        accel_to_pub.header.stamp
-        accel_to_pub.header.frame_id = 'World'
+        accel_to_pub = self.accel_to_pub
+        accel_to_pub.header.stamp = msg.header.stamp
         accel_to_pub.accel.accel.linear.x = - msg.accel.linear.x
         accel_to_pub.accel.accel.linear.y = msg.accel.linear.z
         accel_to_pub.accel.accel.linear.z = msg.accel.linear.y
@@ -98,22 +98,21 @@ def main():
 
     # Publishers
     ############
-    mc.posepub = rospy.Publisher('/pidrone/pose', PoseWithCovarianceStamped, queue_size=1, tcp_nodelay=False)
-    mc.twistpub = rospy.Publisher('/pidrone/twist', TwistWithCovarianceStamped, queue_size=1, tcp_nodelay=False)
-    mc.accelpub = rospy.Publisher('/pidrone/accel', AccelWithCovarianceStamped, queue_size=1, tcp_nodelay=False)
+    mc.posepub = rospy.Publisher('/pidrone/pose', PoseWithCovarianceStamped, queue_size=1, tcp_nodelay=True)
+    mc.twistpub = rospy.Publisher('/pidrone/twist', TwistWithCovarianceStamped, queue_size=1, tcp_nodelay=True)
+    mc.accelpub = rospy.Publisher('/pidrone/accel', AccelWithCovarianceStamped, queue_size=1, tcp_nodelay=True)
 
     # Subscribers
     #############
-    rospy.Subscriber(str(mc.mocap_pose_topic), PoseStamped, mc.pose_callback)
-    rospy.Subscriber(str(mc.mocap_twist_topic), TwistStamped, mc.twist_callback)
-    rospy.Subscriber(str(mc.mocap_accel_topic), AccelStamped, mc.accel_callback)
+    rospy.Subscriber(str(mc.mocap_pose_topic), PoseStamped, mc.pose_callback, queue_size=1, buff_size=2**20, tcp_nodelay=True)
+    rospy.Subscriber(str(mc.mocap_twist_topic), TwistStamped, mc.twist_callback, queue_size=1, buff_size=2**20, tcp_nodelay=True)
+    rospy.Subscriber(str(mc.mocap_accel_topic), AccelStamped, mc.accel_callback, queue_size=1, buff_size=2**20, tcp_nodelay=True)
 
     # wait for data from the mocap
     # set up ctrl-c handler
     signal.signal(signal.SIGINT, mc.ctrl_c_handler)
     print 'waiting for mocap data'
-    while not mc.received_data:
-        pass
+    rospy.wait_for_message(str(mc.mocap_pose_topic), PoseStamped)
 
     # print the topics that are being published to
     print 'Publishing to:'
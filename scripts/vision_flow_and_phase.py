@@ -36,12 +36,15 @@ def main():
                     camera.start_recording("/dev/null", format='h264', splitter_port=1, motion_output=flow_analyzer)
                     camera.start_recording(phase_analyzer, format='bgr', splitter_port=2)
                     # nonblocking wait
+                    last_image = None
                     while not rospy.is_shutdown():
                         camera.wait_recording(1/100.0)
-                        # publish the raw image
-                        if phase_analyzer.previous_image is not None:
-                            image_message = bridge.cv2_to_imgmsg(phase_analyzer.previous_image, encoding="bgr8")
+                        # publish the raw image, only if a new one was stored
+                        image = phase_analyzer.previous_image
+                        if image is not None and image is not last_image:
+                            image_message = bridge.cv2_to_imgmsg(image, encoding="bgr8")
                             image_pub.publish(image_message)
+                            last_image = image
                 # safely shutdown the camera recording for flow_analyzer
                 camera.stop_recording(splitter_port=1)
             # safely shutdown the camera recording for phase_analyzer